@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import argparse
-import json
+from datetime import datetime
 from pathlib import Path
 
-from .ingest import load_candidate, load_job, load_job_from_url, save_job_text, load_job_from_url_dynamic
+from .ingest import load_job, load_job_from_url, save_job_text, load_job_from_url_dynamic
+from .jsonio import dump_json, load_json
+from .schemas import candidate_from_dict
 from .match import select_bullets
 from .generate import build_resume_context, build_cover_letter
-from .render import render_resume, render_cover_letter, try_export_pdf
+from .render import render_resume, render_cover_letter, try_export_pdfs
 from .evaluate import summarize_evaluation
 from .review import interactive_review
-from .llm import refine_resume_ctx_with_llm, generate_cover_letter_with_llm
+from .llm import refine_resume_ctx_with_llm, generate_cover_letter_with_llm, refine_and_letter_with_llm
 
 
 def main():
@@ -20,6 +22,7 @@ def main():
     parser.add_argument("--browser-scrape", action="store_true", help="Use a headless browser (Playwright) to render JS and extract the JD accurately")
     parser.add_argument("--browser-wait", help="CSS selector to wait for before scraping (optional)")
     parser.add_argument("--browser-timeout", type=int, default=15000, help="Playwright navigation/selector timeout in milliseconds")
+    parser.add_argument("--browser-reuse", action="store_true", help="Keep a persistent browser profile across runs (faster repeat scrapes)")
     parser.add_argument("--candidate", required=True, help="Path to candidate JSON profile")
     parser.add_argument("--out", required=True, help="Output directory")
     parser.add_argument("--title", help="Target role title (optional; overrides detected)")
@@ -46,7 +49,10 @@ def main():
 
     args = parser.parse_args()
 
-    candidate = load_candidate(args.candidate)
+    # Keep the raw dict around: the --build-index path needs the JSON shape and
+    # should not re-read/parse the same file.
+    candidate_data = load_json(args.candidate)
+    candidate = candidate_from_dict(candidate_data)
     if args.job_url:
         if args.browser_scrape:
             job = load_job_from_url_dynamic(
@@ -56,6 +62,7 @@ def main():
                 location=args.location,
                 wait_selector=args.browser_wait,
                 timeout_ms=args.browser_timeout,
+                reuse_browser=args.browser_reuse,
             )
         else:
             job = load_job_from_url(args.job_url, title=args.title, company=args.company, location=args.location)
@@ -74,7 +81,6 @@ def main():
         print(f"Saved extracted JD to: {path}")
     elif args.jd_save_auto:
         # Save under output directory with timestamp
-        from datetime import datetime
         ts = datetime.now().strftime("%Y%m%d-%H%M%S")
         out_dir = Path(args.out)
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -115,7 +121,7 @@ def main():
                 # Build on the fly from current candidate
                 from .vectorstore import build_tfidf_index_from_candidate
                 tmp = args.index
-                build_tfidf_index_from_candidate(json.loads(Path(args.candidate).read_text(encoding="utf-8")), tmp)
+                build_tfidf_index_from_candidate(candidate_data, tmp)
                 store = TfidfStore.load(tmp)
             else:
                 store = None
@@ -136,14 +142,7 @@ def main():
 
     # Optional LLM refinement (only if API key available and flag enabled)
     if args.llm:
-        try:
-            resume_ctx = refine_resume_ctx_with_llm(
-                resume_ctx, job_keywords=job.keywords, model=args.llm_model, temperature=args.llm_temp
-            )
-        except Exception:
-            pass
-        try:
-            # Collect highlights from selected bullets after refinement
+        def collect_highlights() -> list[str]:
             hl = []
             for exp in resume_ctx.get("experiences", []):
                 hl.extend([b.get("text", "") for b in exp.get("bullets", [])])
@@ -153,18 +152,43 @@ def main():
                 if t not in seen:
                     hl.append(t)
                     seen.add(t)
-            llm_letter = generate_cover_letter_with_llm(
-                resume_ctx.get("identity", {}), resume_ctx.get("job", {}), hl[:4], personal_notes, model=args.llm_model, temperature=max(args.llm_temp, 0.5)
+            return hl
+
+        # Prefer a single round trip covering bullets + letter (half the LLM latency)
+        combined = None
+        try:
+            combined = refine_and_letter_with_llm(
+                resume_ctx, job_keywords=job.keywords, highlights=collect_highlights()[:4],
+                personal_notes=personal_notes, model=args.llm_model, temperature=args.llm_temp,
             )
-            if llm_letter:
-                letter_ctx = llm_letter
         except Exception:
-            pass
+            combined = None
+        if combined:
+            resume_ctx = combined["resume_ctx"]
+            if combined.get("letter_ctx"):
+                letter_ctx = combined["letter_ctx"]
+        else:
+            # Fall back to the original two sequential calls
+            try:
+                resume_ctx = refine_resume_ctx_with_llm(
+                    resume_ctx, job_keywords=job.keywords, model=args.llm_model, temperature=args.llm_temp
+                )
+            except Exception:
+                pass
+            try:
+                # Collect highlights from selected bullets after refinement
+                hl = collect_highlights()
+                llm_letter = generate_cover_letter_with_llm(
+                    resume_ctx.get("identity", {}), resume_ctx.get("job", {}), hl[:4], personal_notes, model=args.llm_model, temperature=max(args.llm_temp, 0.5)
+                )
+                if llm_letter:
+                    letter_ctx = llm_letter
+            except Exception:
+                pass
 
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    from datetime import datetime
     safe_name = candidate.identity.name.replace(" ", "_") or "Candidate"
     safe_role = (args.title or job.title or "Role").replace(" ", "_")
     safe_company = (args.company or job.company or "Company").replace(" ", "_")
@@ -207,12 +231,11 @@ def main():
         "evaluation": eval_report,
         "edits": edits,
     }
-    with trace_path.open("w", encoding="utf-8") as f:
-        json.dump(trace_payload, f, ensure_ascii=False, indent=2)
+    dump_json(trace_path, trace_payload)
 
     if not args.no_pdf:
-        try_export_pdf(resume_path)
-        try_export_pdf(cover_letter_path)
+        # One converter invocation for both documents
+        try_export_pdfs([resume_path, cover_letter_path])
 
     print("Generated:")
     print("-", resume_path)
@@ -22,16 +22,47 @@ DEGREE_KEYWORDS = [
     "bachelor", "master", "phd", "b.s.", "b.s", "bs", "m.s.", "m.s", "ms", "mba", "ba", "ma",
 ]
 
+# Precompiled patterns for the per-line parsing loops (avoids re-cache lookups on hot paths)
+BULLET_RE = re.compile(r"^([\-\*\u2022\u2023\u25E6\u2043\u2219]|\d+\.|\d+\))\s+")
+DATE_RE = re.compile(r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|\b\d{4})", re.I)
+YEAR_RE = re.compile(r"\b\d{4}\b")
+DEGREE_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in DEGREE_KEYWORDS) + r")\b", re.I)
+AT_SPLIT_RE = re.compile(r"\s+at\s+", re.I)
+BLANK_RUN_RE = re.compile(r"\n{3,}")
+SKILL_SPLIT_RE = re.compile(r"[\n,;]\s*")
+
+# Inverted alias index: one dict lookup per line instead of scanning every alias set
+ALIAS_TO_KEY = {a: k for k, aliases in SECTION_ALIASES.items() for a in aliases}
+
+# Standalone section-heading matcher (longest aliases first so "work experience"
+# wins over "experience"); backs extract_section_snippet below
+_SECTION_HEADING_RE = re.compile(
+    r"(?im)^[ \t]*(" + "|".join(sorted((re.escape(a) for a in ALIAS_TO_KEY), key=len, reverse=True)) + r")[ \t]*:?[ \t]*$"
+)
+
 
 def read_text_from_pdf(path: str) -> str:
+    # PyMuPDF extracts at C speed (5-30x faster than pure-Python readers);
+    # use it when installed and keep pypdf as the portable fallback.
+    try:
+        import fitz  # type: ignore  # PyMuPDF
+
+        doc = fitz.open(path)
+        try:
+            return "\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+    except Exception:
+        pass
     reader = PdfReader(path)
-    chunks: List[str] = []
-    for page in reader.pages:
+    # Preallocate one slot per page; skip empty pages when joining
+    chunks: List[str] = [""] * len(reader.pages)
+    for i, page in enumerate(reader.pages):
         try:
-            chunks.append(page.extract_text() or "")
+            chunks[i] = page.extract_text() or ""
         except Exception:
             continue
-    return "\n".join(chunks)
+    return "\n".join(c for c in chunks if c)
 
 
 def read_text_from_docx(path: str) -> str:
@@ -44,20 +75,29 @@ def read_text_from_docx(path: str) -> str:
     return "\n".join(paras)
 
 
+# Suffix -> reader dispatch; extend here to register new formats (e.g. ".rtf")
+_READERS = {
+    ".pdf": read_text_from_pdf,
+    ".docx": read_text_from_docx,
+}
+
+
 def read_text_generic(path: str) -> str:
     p = Path(path)
-    if p.suffix.lower() == ".pdf":
-        return read_text_from_pdf(str(p))
-    if p.suffix.lower() in {".docx"}:
-        return read_text_from_docx(str(p))
+    reader = _READERS.get(p.suffix.lower())
+    if reader:
+        return reader(str(p))
     return p.read_text(encoding="utf-8", errors="ignore")
 
 
 def normalize_text(text: str) -> str:
-    t = unidecode(text or "")
+    if not text:
+        return ""
+    # unidecode is expensive; most extracted text is already ASCII
+    t = text if text.isascii() else unidecode(text)
     t = t.replace("\r", "\n")
     # Collapse excessive blank lines
-    t = re.sub(r"\n{3,}", "\n\n", t)
+    t = BLANK_RUN_RE.sub("\n\n", t)
     return t
 
 
@@ -67,9 +107,12 @@ def detect_sections(lines: List[str]) -> Dict[str, Tuple[int, int]]:
     headings: List[Tuple[str, int]] = []
     for i, ln in enumerate(lines):
         clean = ln.strip().lower().strip(" :")
-        for key, aliases in SECTION_ALIASES.items():
-            if clean in aliases or any(clean.startswith(a + ":") for a in aliases):
-                headings.append((key, i))
+        key = ALIAS_TO_KEY.get(clean)
+        if key is None and ":" in clean:
+            # Heading with inline content, e.g. "skills: python, sql"
+            key = ALIAS_TO_KEY.get(clean.split(":", 1)[0].rstrip())
+        if key:
+            headings.append((key, i))
     # Add sentinel end
     headings.sort(key=lambda x: x[1])
     for j, (key, start) in enumerate(headings):
@@ -84,9 +127,8 @@ def parse_bullets(block_lines: List[str]) -> List[str]:
         s = ln.strip()
         if not s:
             continue
-        if re.match(r"^([\-\*\u2022\u2023\u25E6\u2043\u2219]|\d+\.|\d+\))\s+", s):
-            s = re.sub(r"^([\-\*\u2022\u2023\u25E6\u2043\u2219]|\d+\.|\d+\))\s+", "", s)
-            bullets.append(s)
+        if BULLET_RE.match(s):
+            bullets.append(BULLET_RE.sub("", s))
     # If no explicit bullet markers, treat each non-empty line as a potential bullet but keep it conservative
     if not bullets and block_lines:
         bullets = [ln.strip() for ln in block_lines if ln.strip()]
@@ -107,7 +149,7 @@ def parse_experience(lines: List[str]) -> List[Dict]:
         company = ""
         # Try role/company separators
         if " at " in header.lower():
-            parts = re.split(r"\s+at\s+", header, flags=re.I)
+            parts = AT_SPLIT_RE.split(header)
             if len(parts) == 2:
                 role, company = parts[0].strip(), parts[1].strip()
         elif " | " in header:
@@ -119,7 +161,7 @@ def parse_experience(lines: List[str]) -> List[Dict]:
 
         # Dates: scan lines for year patterns
         text = " \n".join(chunk)
-        m = re.findall(r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|\b\d{4})", text, flags=re.I)
+        m = DATE_RE.findall(text)
         start = m[0] if m else None
         end = m[-1] if len(m) > 1 else None
 
@@ -145,18 +187,13 @@ def parse_experience(lines: List[str]) -> List[Dict]:
 
 
 def parse_skills(lines: List[str]) -> List[str]:
-    text = " ".join(lines)
-    parts = re.split(r"[\n,;]\s*", text)
-    skills = [p.strip() for p in parts if p.strip()]
-    # Deduplicate preserving order
-    seen = set()
-    out: List[str] = []
-    for s in skills:
-        k = s.lower()
-        if k not in seen:
-            seen.add(k)
-            out.append(s)
-    return out
+    parts = (p.strip() for p in SKILL_SPLIT_RE.split(" ".join(lines)))
+    # Case-insensitive dedup preserving order and first-seen casing
+    seen: Dict[str, str] = {}
+    for p in parts:
+        if p:
+            seen.setdefault(p.lower(), p)
+    return list(seen.values())
 
 
 def parse_education(lines: List[str]) -> List[Dict]:
@@ -167,15 +204,12 @@ def parse_education(lines: List[str]) -> List[Dict]:
         if not chunk:
             return
         text = " ".join(chunk)
-        degree = None
-        for kw in DEGREE_KEYWORDS:
-            if re.search(rf"\b{re.escape(kw)}\b", text, flags=re.I):
-                degree = kw
-                break
+        dm = DEGREE_RE.search(text)
+        degree = dm.group(1).lower() if dm else None
         # Institution: take first line
         institution = chunk[0].strip()
         # Years if present
-        m = re.findall(r"\b\d{4}\b", text)
+        m = YEAR_RE.findall(text)
         start = m[0] if m else None
         end = m[1] if len(m) > 1 else None
         out.append({"institution": institution, "degree": degree, "start": start, "end": end})
@@ -190,9 +224,21 @@ def parse_education(lines: List[str]) -> List[Dict]:
     return out
 
 
+def extract_section_snippet(text: str, section_name: str) -> str:
+    # Slice out one section's text without line-splitting or parsing the rest
+    # of the document; useful when a caller only needs e.g. the skills block.
+    for m in _SECTION_HEADING_RE.finditer(text):
+        if ALIAS_TO_KEY.get(m.group(1).lower()) != section_name:
+            continue
+        nxt = _SECTION_HEADING_RE.search(text, m.end())
+        return text[m.end():nxt.start() if nxt else len(text)].strip("\n")
+    return ""
+
+
 def parse_resume_text(text: str) -> Dict:
     text = normalize_text(text)
-    lines = [ln.rstrip() for ln in text.splitlines()]
+    # No per-line rstrip copy: downstream parsers strip lazily where needed
+    lines = text.splitlines()
     sections = detect_sections(lines)
     experiences = parse_experience(lines[sections["experience"][0]:sections["experience"][1]]) if "experience" in sections else []
     skills = parse_skills(lines[sections["skills"][0]:sections["skills"][1]]) if "skills" in sections else []
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Dict, List
 
 from .docs import read_text_generic, parse_resume_text
+from .jsonio import dump_json
 from .linkedin_ingest import load_linkedin_profile_json
 
 
+def _parse_one(path: Path) -> tuple[str, Dict]:
+    # Top-level so it is picklable by ProcessPoolExecutor workers
+    return (path.name, parse_resume_text(read_text_generic(str(path))))
+
+
 def _merge_candidate(pieces: List[Dict], source_ids: List[str], prefer_substr: str | None = None) -> Dict:
     # Merge multiple parsed resumes into a consolidated candidate dict
     work_experience = []
@@ -16,14 +21,13 @@ def _merge_candidate(pieces: List[Dict], source_ids: List[str], prefer_substr: s
     education = []
 
     def dedup_list(items: List[str]) -> List[str]:
-        seen = set()
-        out = []
+        # Case-insensitive dedup preserving order and first-seen casing
+        seen: Dict[str, str] = {}
         for x in items:
-            k = x.strip().lower()
-            if k and k not in seen:
-                seen.add(k)
-                out.append(x.strip())
-        return out
+            s = x.strip()
+            if s:
+                seen.setdefault(s.lower(), s)
+        return list(seen.values())
 
     for piece, sid in zip(pieces, source_ids):
         for exp in piece.get("work_experience", []):
@@ -42,10 +46,27 @@ def _merge_candidate(pieces: List[Dict], source_ids: List[str], prefer_substr: s
         skills_hard.extend(piece.get("skills", []))
         education.extend(piece.get("education", []))
 
+    def _role_key(exp: Dict) -> tuple:
+        # Tuple keys hash faster than joined strings and avoid transient allocations
+        return (
+            (exp.get("company", "") or "").strip().lower(),
+            (exp.get("role", "") or "").strip().lower(),
+            exp.get("start"),
+            exp.get("end"),
+        )
+
+    def _edu_key(ed: Dict) -> tuple:
+        return (
+            (ed.get("institution", "") or "").strip().lower(),
+            (ed.get("degree", "") or "").strip().lower(),
+            str(ed.get("start", "")),
+            str(ed.get("end", "")),
+        )
+
     # Coalesce duplicate roles by (company, role, start, end)
-    merged_roles: Dict[str, Dict] = {}
+    merged_roles: Dict[tuple, Dict] = {}
     for exp in work_experience:
-        key = "|".join([exp.get("company", ""), exp.get("role", ""), str(exp.get("start")), str(exp.get("end"))])
+        key = _role_key(exp)
         slot = merged_roles.setdefault(key, {**exp, "bullets": []})
         existing_texts = {b["text"].strip().lower() for b in slot["bullets"]}
         for b in exp.get("bullets", []):
@@ -55,31 +76,28 @@ def _merge_candidate(pieces: List[Dict], source_ids: List[str], prefer_substr: s
                 existing_texts.add(k)
 
     # Deduplicate education entries by (institution, degree, start, end)
-    edu_map: Dict[str, Dict] = {}
+    edu_map: Dict[tuple, Dict] = {}
     for ed in education:
-        key = "|".join(
-            [
-                (ed.get("institution", "") or "").strip().lower(),
-                (ed.get("degree", "") or "").strip().lower(),
-                str(ed.get("start", "")),
-                str(ed.get("end", "")),
-            ]
-        )
-        if key not in edu_map:
-            edu_map[key] = ed
+        edu_map.setdefault(_edu_key(ed), ed)
 
     merged_experience = list(merged_roles.values())
     # If a preference is given, reorder bullets and experiences to prefer that source
     if prefer_substr:
         pref = prefer_substr.lower()
+        # Computed once per experience while partitioning; reused as the sort key below
+        has_pref: Dict[int, bool] = {}
         for exp in merged_experience:
-            pref_bullets = [b for b in exp.get("bullets", []) if any(pref in sid.lower() for sid in b.get("source_ids", []))]
-            other_bullets = [b for b in exp.get("bullets", []) if b not in pref_bullets]
+            # Single-pass partition (avoids quadratic list-membership checks on bullet dicts)
+            pref_bullets: List[Dict] = []
+            other_bullets: List[Dict] = []
+            for b in exp.get("bullets", []):
+                if any(pref in sid.lower() for sid in b.get("source_ids", [])):
+                    pref_bullets.append(b)
+                else:
+                    other_bullets.append(b)
             exp["bullets"] = pref_bullets + other_bullets
-        merged_experience.sort(
-            key=lambda e: any(pref in sid.lower() for b in e.get("bullets", []) for sid in b.get("source_ids", [])),
-            reverse=True,
-        )
+            has_pref[id(exp)] = bool(pref_bullets)
+        merged_experience.sort(key=lambda e: has_pref[id(e)], reverse=True)
 
     return {
         "identity": {"name": "", "email": "", "phone": "", "location": "", "links": []},
@@ -114,13 +132,16 @@ def main():
     if not files:
         raise SystemExit("No PDF/DOCX/TXT files found in the input folder.")
 
-    pieces: List[Dict] = []
-    source_ids: List[str] = []
-    for f in files:
-        text = read_text_generic(str(f))
-        parsed = parse_resume_text(text)
-        pieces.append(parsed)
-        source_ids.append(f.name)
+    # Parsing is CPU-bound (PDF extraction + regex) and independent per file;
+    # fan out across processes when there is more than one file.
+    if len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(_parse_one, files))  # ordered, matches `files`
+    else:
+        results = [_parse_one(f) for f in files]
+    source_ids: List[str] = [name for name, _ in results]
+    pieces: List[Dict] = [parsed for _, parsed in results]
 
     # LinkedIn ingest (optional)
     if args.linkedin:
@@ -167,7 +188,7 @@ def main():
                 merged["identity"]["links"] = [s.strip() for s in ln.split(",") if s.strip()]
 
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-    Path(args.out).write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+    dump_json(args.out, merged)
     print(f"Wrote candidate JSON: {args.out}")
 
 
@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import re
+from typing import Dict, List, Optional
 
+# One tokenizer for corpus and keywords: keeps tech tokens like "node.js"/"c#"
+# intact while splitting on everything else in a single C-level findall pass.
+_TOKEN_RE = re.compile(r"[a-z0-9+.#-]+")
 
-def keyword_coverage(job_keywords: List[str], resume_ctx: Dict) -> Dict:
-    # Build a simple token set from selected bullets + skills
-    def norm(t: str) -> str:
-        return t.lower().strip().strip(".,;:!?()[]{}")
 
-    tokens = set()
-    for exp in resume_ctx.get("experiences", []):
-        for b in exp.get("bullets", []):
-            tokens.update(norm(w) for w in b.get("text", "").split())
-    for s in resume_ctx.get("skills", []):
-        tokens.add(norm(s))
+def _norm(t: str) -> str:
+    return " ".join(m.strip(".-") for m in _TOKEN_RE.findall(t.lower()))
 
-    kws = [norm(k) for k in job_keywords if k]
-    covered = [k for k in kws if k in tokens]
-    missing = [k for k in kws if k not in tokens]
+
+def normalize_keywords(keywords: List[str]) -> List[str]:
+    # Precomputed once at job load so coverage calls don't re-normalize
+    return [_norm(k) for k in keywords if k]
+
+
+def keyword_coverage(job_keywords: List[str], resume_ctx: Dict, norm_keywords: Optional[List[str]] = None) -> Dict:
+    # Build a simple token set from selected bullets + skills; join once, tokenize once
+    big = " ".join(
+        b.get("text", "")
+        for exp in resume_ctx.get("experiences", [])
+        for b in exp.get("bullets", [])
+    ).lower()
+    big += " " + " ".join(s.lower() for s in resume_ctx.get("skills", []))
+    tokens = {t.strip(".-") for t in _TOKEN_RE.findall(big)}
+
+    kws = list(norm_keywords) if norm_keywords is not None else normalize_keywords(job_keywords)
+    # Set ops run in C; the final list passes just restore display order
+    covered_set = set(kws) & tokens
+    covered = [k for k in kws if k in covered_set]
+    missing = [k for k in kws if k not in covered_set]
 
     coverage = (len(covered) / max(1, len(kws))) if kws else 0.0
     top_missing = missing[:15]
@@ -31,7 +45,7 @@ def keyword_coverage(job_keywords: List[str], resume_ctx: Dict) -> Dict:
 
 
 def summarize_evaluation(job: Dict, resume_ctx: Dict) -> Dict:
-    cov = keyword_coverage(job.get("keywords", []), resume_ctx)
+    cov = keyword_coverage(job.get("keywords", []), resume_ctx, norm_keywords=job.get("norm_keywords"))
     # Simple signals for potential improvements
     suggestions: List[str] = []
     if cov["coverage"] < 0.35:
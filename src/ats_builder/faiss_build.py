@@ -8,13 +8,12 @@ from .faiss_store import FAISSStore, EmbChunk
 
 
 def chunks_from_candidate(candidate: dict) -> list[EmbChunk]:
-    chunks: list[EmbChunk] = []
-    for ridx, exp in enumerate(candidate.get("work_experience", [])):
-        for b in exp.get("bullets", []):
-            chunks.append(EmbChunk(text=b.get("text", ""), meta={"role_index": ridx, "role": exp.get("role", ""), "company": exp.get("company", ""), "source_ids": b.get("source_ids", [])}))
-    for s in candidate.get("skills", {}).get("hard", []):
-        chunks.append(EmbChunk(text=s, meta={"type": "skill"}))
-    return chunks
+    # Flat comprehensions: no per-item append dispatch on large bullet sets
+    return [
+        EmbChunk(text=b.get("text", ""), meta={"role_index": ridx, "role": exp.get("role", ""), "company": exp.get("company", ""), "source_ids": b.get("source_ids", [])})
+        for ridx, exp in enumerate(candidate.get("work_experience", []))
+        for b in exp.get("bullets", [])
+    ] + [EmbChunk(text=s, meta={"type": "skill"}) for s in candidate.get("skills", {}).get("hard", [])]
 
 
 def main():
@@ -22,10 +21,11 @@ def main():
     parser.add_argument("--candidate", required=True, help="Path to candidate JSON")
     parser.add_argument("--out", required=True, help="Output path (e.g., .index/candidate.faiss.pkl)")
     parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2", help="Sentence-transformers model name")
+    parser.add_argument("--quant", choices=["sq8", "flat"], default="sq8", help="Index quantization: 8-bit scalar (smaller/faster) or exact float32")
     args = parser.parse_args()
 
     candidate = json.loads(Path(args.candidate).read_text(encoding="utf-8"))
-    store = FAISSStore(chunks_from_candidate(candidate)).build(model_name=args.model)
+    store = FAISSStore(chunks_from_candidate(candidate)).build(model_name=args.model, quant=args.quant)
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
     store.save(args.out)
     print(f"Wrote FAISS index: {args.out}")
@@ -1,35 +1,93 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
 import joblib
 
+from .jsonio import dump_json, load_json
 
-@dataclass
+
+@dataclass(slots=True)
 class EmbChunk:
     text: str
     meta: Dict
 
 
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str):
+    # Loading SentenceTransformer weights costs seconds; cache per process so
+    # repeated search()/build() calls pay it once.
+    try:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+    except Exception as e:
+        raise RuntimeError("sentence-transformers not installed") from e
+    try:
+        import os
+        import torch  # type: ignore
+        torch.set_num_threads(os.cpu_count() or 1)
+    except Exception:
+        pass
+    model = SentenceTransformer(model_name)
+    model.eval()
+    return model
+
+
+# Above this size brute-force scans stop being free; switch to IVF
+_IVF_THRESHOLD = 1000
+
+
+def _make_index(embs, quant: str):
+    # Small corpora: exact scan (flat float32 or SQ8 8-bit codes, 4x less memory
+    # with negligible recall loss). Large corpora: IVF for sub-linear search.
+    import faiss  # type: ignore
+    n, dim = embs.shape
+    if n >= _IVF_THRESHOLD:
+        nlist = max(1, min(4 * int(n ** 0.5), n // 39))
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFFlat(quantizer, dim, nlist, faiss.METRIC_INNER_PRODUCT)
+        index.train(embs)
+        index.add(embs)
+        index.nprobe = 8
+        return index
+    if quant == "sq8":
+        index = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+        index.train(embs)
+    else:
+        index = faiss.IndexFlatIP(dim)
+    index.add(embs)
+    return index
+
+
 class FAISSStore:
     def __init__(self, chunks: List[EmbChunk]):
         self.chunks = chunks
         self.embeddings = None
         self.index = None
         self.model_name = None
+        self.quant = "flat"
 
     @staticmethod
     def _embed_texts(texts: List[str], model_name: str):
-        try:
-            from sentence_transformers import SentenceTransformer  # type: ignore
-        except Exception as e:
-            raise RuntimeError("sentence-transformers not installed") from e
-        model = SentenceTransformer(model_name)
-        return model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+        import numpy as np  # type: ignore
+        model = _get_model(model_name)
+        # Encode in length-sorted order so each mini-batch pads only to its
+        # longest sibling (less wasted compute on padding), then restore order.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embs = model.encode(
+            [texts[i] for i in order],
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        out = np.empty_like(embs)
+        out[order] = embs
+        return out
 
-    def build(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", dedup_threshold: float = 0.9):
+    def build(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", dedup_threshold: float = 0.9, quant: str = "sq8"):
         # Embed
         texts = [c.text for c in self.chunks]
         if not texts:
@@ -37,58 +95,75 @@ class FAISSStore:
             self.index = None
             return self
         embs = self._embed_texts(texts, model_name)
-        # Deduplicate highly similar chunks
+        # Deduplicate highly similar chunks. Embeddings are L2-normalized, so an
+        # inner-product range_search yields exactly the near-duplicate pairs
+        # without materializing an N x N similarity matrix.
         try:
-            import numpy as np  # type: ignore
-            from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
+            import faiss  # type: ignore
         except Exception as e:
-            raise RuntimeError("numpy/sklearn not installed for FAISS dedup") from e
-        sims = cosine_similarity(embs)
+            raise RuntimeError("faiss-cpu not installed") from e
+        tmp = faiss.IndexFlatIP(embs.shape[1])
+        tmp.add(embs)
+        lims, _, I = tmp.range_search(embs, float(dedup_threshold))
         keep = []
         seen = set()
         for i in range(len(texts)):
             if i in seen:
                 continue
             keep.append(i)
-            dups = np.where(sims[i] >= dedup_threshold)[0]
-            for j in dups:
-                seen.add(int(j))
+            for j in I[lims[i]:lims[i + 1]]:
+                if int(j) > i:
+                    seen.add(int(j))
         kept_chunks = [self.chunks[i] for i in keep]
         kept_embs = embs[keep]
 
         # Build FAISS index
         try:
-            import faiss  # type: ignore
-        except Exception as e:
+            index = _make_index(kept_embs, quant)
+        except ImportError as e:
             raise RuntimeError("faiss-cpu not installed") from e
-        dim = kept_embs.shape[1]
-        index = faiss.IndexFlatIP(dim)
-        index.add(kept_embs)
 
         self.chunks = kept_chunks
         self.embeddings = kept_embs
         self.index = index
         self.model_name = model_name
+        self.quant = quant
         return self
 
     def search(self, query: str, top_k: int = 8) -> List[EmbChunk]:
-        if self.index is None:
+        if self.index is None or not self.chunks:
             return []
-        try:
-            import numpy as np  # type: ignore
-        except Exception:
-            return []
-        q = self._embed_texts([query], self.model_name)
+        if top_k >= len(self.chunks):
+            # Caller wants everything; skip the encode + index scan entirely
+            return list(self.chunks)
+        if not self.model_name:
+            raise RuntimeError("model_name missing; was this store built or loaded?")
+        q = _embed_query(query, self.model_name)
         D, I = self.index.search(q, top_k)  # type: ignore
         idxs = [int(i) for i in I[0] if i >= 0]
         return [self.chunks[i] for i in idxs]
 
+    def search_batch(self, queries: List[str], top_k: int = 8) -> List[List[EmbChunk]]:
+        # Faiss only parallelizes across query rows; submitting them together
+        # runs one batched GEMM instead of N sequential scans.
+        if self.index is None or not queries:
+            return [[] for _ in queries]
+        q = self._embed_texts(queries, self.model_name)
+        D, I = self.index.search(q, top_k)  # type: ignore
+        return [[self.chunks[int(i)] for i in row if i >= 0] for row in I]
+
     def save(self, path: str):
-        joblib.dump({
-            "chunks": self.chunks,
-            "embeddings": self.embeddings,
-            "model": self.model_name,
-        }, path)
+        # Persist the trained index natively (quantized codes, no float32
+        # round-trip); chunks and metadata go to JSON rather than pickle, and
+        # any raw embeddings to a mmap-able .npy.
+        if self.index is not None:
+            import faiss  # type: ignore
+            faiss.write_index(self.index, path + ".faiss")
+        elif self.embeddings is not None:
+            import numpy as np  # type: ignore
+            np.save(path + ".npy", self.embeddings)
+        dump_json(path + ".chunks.json", [{"text": c.text, "meta": c.meta} for c in self.chunks])
+        dump_json(path, {"model": self.model_name, "quant": self.quant})
 
     @staticmethod
     def load(path: str) -> "FAISSStore":
@@ -96,18 +171,39 @@ class FAISSStore:
             import faiss  # type: ignore
         except Exception as e:
             raise RuntimeError("faiss-cpu not installed") from e
-        data = joblib.load(path)
-        chunks = data["chunks"]
-        embs = data["embeddings"]
-        model_name = data.get("model", "sentence-transformers/all-MiniLM-L6-v2")
+        chunks_path = Path(path + ".chunks.json")
+        embs = None
+        if chunks_path.exists():
+            meta = load_json(path)
+            chunks = [EmbChunk(text=c.get("text", ""), meta=c.get("meta", {})) for c in load_json(chunks_path)]
+            model_name = meta.get("model", "sentence-transformers/all-MiniLM-L6-v2")
+            quant = meta.get("quant", "flat")
+        else:
+            # Legacy joblib payloads (pickled chunks, possibly raw embeddings)
+            data = joblib.load(path)
+            chunks = data["chunks"]
+            model_name = data.get("model", "sentence-transformers/all-MiniLM-L6-v2")
+            quant = data.get("quant", "flat")
+            embs = data.get("embeddings")
         store = FAISSStore(chunks)
         store.model_name = model_name
-        # Rebuild index from saved embeddings
+        store.quant = quant
+        idx_path = Path(path + ".faiss")
+        if idx_path.exists():
+            store.index = faiss.read_index(str(idx_path))
+            return store
+        if embs is None and Path(path + ".npy").exists():
+            import numpy as np  # type: ignore
+            embs = np.load(path + ".npy", mmap_mode="r")
         if embs is not None:
-            dim = embs.shape[1]
-            index = faiss.IndexFlatIP(dim)
-            index.add(embs)
+            import numpy as np  # type: ignore
+            embs = np.ascontiguousarray(embs, dtype="float32")
             store.embeddings = embs
-            store.index = index
+            store.index = _make_index(embs, store.quant)
         return store
 
+
+@functools.lru_cache(maxsize=256)
+def _embed_query(text: str, model_name: str):
+    # Repeated searches for the same JD skip re-encoding entirely
+    return FAISSStore._embed_texts([text], model_name)
@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Dict, List
 
 from .schemas import Candidate, JobPosting, SelectionResult
 
 
 def build_resume_context(candidate: Candidate, job: JobPosting, selection: SelectionResult) -> Dict:
-    # Build a renderable structure while preserving source trace
+    # Build a renderable structure while preserving source trace.
+    # Trace bullets are collected in the same sweep instead of re-walking
+    # selected_by_role afterwards.
     experiences = []
+    trace_bullets: List[Dict] = []
     for idx, exp in enumerate(candidate.work_experience):
         picked = selection.selected_by_role.get(idx, [])
-        bullets = [
-            {
-                "text": sb.text,
-                "source_ids": sb.source_ids,
-            }
-            for sb in picked
-        ]
+        bullets = []
+        for sb in picked:
+            bullets.append({"text": sb.text, "source_ids": sb.source_ids})
+            trace_bullets.append(
+                {
+                    "text": sb.text,
+                    "source_ids": sb.source_ids,
+                    "role_index": idx,
+                    "score": sb.score,
+                }
+            )
         experiences.append(
             {
                 "company": exp.company,
@@ -27,7 +35,7 @@ def build_resume_context(candidate: Candidate, job: JobPosting, selection: Selec
             }
         )
 
-    skills = list(dict.fromkeys(candidate.skills_hard + candidate.skills_soft))
+    skills = list(dict.fromkeys(chain(candidate.skills_hard, candidate.skills_soft)))
 
     return {
         "identity": {
@@ -50,21 +58,14 @@ def build_resume_context(candidate: Candidate, job: JobPosting, selection: Selec
         "skills": skills,
         "trace": {
             # Flat bullet trace for transparency
-            "bullets": [
-                {
-                    "text": sb.text,
-                    "source_ids": sb.source_ids,
-                    "role_index": ridx,
-                    "score": sb.score,
-                }
-                for ridx, lst in selection.selected_by_role.items() for sb in lst
-            ]
+            "bullets": trace_bullets
         },
         "job": {
             "title": job.title,
             "company": job.company,
             "location": job.location,
             "keywords": job.keywords,
+            "norm_keywords": job.norm_keywords,
         },
     }
 
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-import json
+import atexit
+import re
+import threading
+from html import unescape as _unescape
+from collections import Counter
 from pathlib import Path
-from typing import Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional
 
+from .jsonio import load_json
 from .schemas import candidate_from_dict, job_from_text, Candidate, JobPosting
 
 
@@ -12,6 +17,13 @@ STOPWORDS = {
     "our","your","you","us","it","into","across","using","use","team","work","role","company","llc","inc","co","corp"
 }
 
+# Compiled once: extract_keywords runs on every JD load and URL fetch
+_TOKEN_RE = re.compile(r"[A-Za-z0-9+#\.\-/]+")
+# LD+JSON descriptions are simple HTML fragments; a regex strip beats a second
+# full BeautifulSoup parse by orders of magnitude
+_TAG_RE = re.compile(r"<[^>]+>")
+_BOOST_SUBSTRINGS = ("sql","aws","azure","gcp","etl","crm","erp","sap","python","java","excel","saas","api","ml","ai","pm")
+
 
 def read_job_text(path: str) -> str:
     p = Path(path)
@@ -20,23 +32,25 @@ def read_job_text(path: str) -> str:
 
 def extract_keywords(text: str, top_k: int = 40) -> List[str]:
     # Simple keyword extraction: frequency-based, alnum tokens, lowercased, filtered stopwords, len>=2
-    from collections import Counter
-    import re
-
-    tokens = [t.lower() for t in re.findall(r"[A-Za-z0-9+#\.\-/]+", text)]
-    tokens = [t.strip(".-/") for t in tokens if t and t.lower() not in STOPWORDS and len(t) > 1]
-    counts = Counter(tokens)
+    matches = _TOKEN_RE.findall(text)
+    # Single fused pass feeding Counter directly (no intermediate token lists);
+    # remember which tokens appeared uppercased for the boost below.
+    counts = Counter(
+        t2 for t in matches
+        if (t2 := t.lower().strip(".-/")) and len(t2) > 1 and t2 not in STOPWORDS
+    )
+    has_upper = {t.lower().strip(".-/") for t in matches if any(ch.isupper() for ch in t)}
     # Favor tech/skill tokens by simple heuristics
     for t in list(counts.keys()):
-        if any(ch.isupper() for ch in t):
+        if t in has_upper:
             counts[t] += 1
-        if any(c in t for c in ["sql","aws","azure","gcp","etl","crm","erp","sap","python","java","excel","saas","api","ml","ai","pm"]):
+        if any(c in t for c in _BOOST_SUBSTRINGS):
             counts[t] += 1
     return [w for w, _ in counts.most_common(top_k)]
 
 
 def load_candidate(path: str) -> Candidate:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    data = load_json(path)
     return candidate_from_dict(data)
 
 
@@ -46,15 +60,31 @@ def load_job(path: str, title: str | None = None, company: str | None = None, lo
     return job_from_text(text, title=title, company=company, location=location, keywords=keywords)
 
 
+def _ldjson_scripts(html: str) -> List[str]:
+    # lxml parses at C speed and XPath pulls only the target scripts; fall back
+    # to BeautifulSoup's full-tree walk for markup lxml rejects.
+    try:
+        from lxml import html as lxml_html  # type: ignore
+        tree = lxml_html.fromstring(html)
+        return tree.xpath('//script[@type="application/ld+json"]/text()')
+    except Exception:
+        pass
+    try:
+        from bs4 import BeautifulSoup  # type: ignore
+        soup = BeautifulSoup(html, "html.parser")
+        return [tag.string or "" for tag in soup.find_all("script", {"type": "application/ld+json"})]
+    except Exception:
+        return []
+
+
 def _extract_main_text_from_html(html: str) -> str:
     # Try structured data (LD+JSON) first for JobPosting.description
     try:
         from bs4 import BeautifulSoup  # type: ignore
         import json as _json
-        soup = BeautifulSoup(html, "html.parser")
-        for tag in soup.find_all("script", {"type": "application/ld+json"}):
+        for raw in _ldjson_scripts(html):
             try:
-                data = _json.loads(tag.string or "")
+                data = _json.loads(raw or "")
             except Exception:
                 continue
             # Handle list or single dict
@@ -64,7 +94,9 @@ def _extract_main_text_from_html(html: str) -> str:
                 if "jobposting" in t and it.get("description"):
                     # Strip HTML tags from description if any
                     desc_html = it.get("description")
-                    desc = BeautifulSoup(desc_html, "html.parser").get_text("\n")
+                    desc = _unescape(_TAG_RE.sub(" ", desc_html))
+                    if not desc.strip():
+                        desc = BeautifulSoup(desc_html, "html.parser").get_text("\n")
                     if desc and len(desc.split()) > 40:
                         return desc
     except Exception:
@@ -106,8 +138,8 @@ def _extract_main_text_from_html(html: str) -> str:
 def load_job_from_url(url: str, title: Optional[str] = None, company: Optional[str] = None, location: Optional[str] = None) -> JobPosting:
     # Fetch HTML
     try:
-        import requests  # type: ignore
-        resp = requests.get(url, timeout=20)
+        from .netio import SESSION  # lazy import
+        resp = SESSION.get(url, timeout=20)
         resp.raise_for_status()
         html = resp.text
     except Exception as e:
@@ -120,6 +152,15 @@ def load_job_from_url(url: str, title: Optional[str] = None, company: Optional[s
     return job_from_text(text=text, title=title, company=company, location=location, keywords=keywords)
 
 
+def load_jobs_from_urls(urls: List[str], max_workers: int = 8) -> List[JobPosting]:
+    # Fetches are network-bound; overlapping them scales roughly with max_workers
+    if len(urls) <= 1:
+        return [load_job_from_url(u) for u in urls]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(load_job_from_url, urls))
+
+
 def save_job_text(job: JobPosting, out_path: str) -> str:
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -127,14 +168,69 @@ def save_job_text(job: JobPosting, out_path: str) -> str:
     return str(p)
 
 
-def load_job_from_url_dynamic(url: str, title: Optional[str] = None, company: Optional[str] = None, location: Optional[str] = None, wait_selector: Optional[str] = None, timeout_ms: int = 15000) -> JobPosting:
+# Chromium flags that cut cold-start CPU/memory for headless text scraping
+_BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-renderer-backgrounding",
+    "--mute-audio",
+    "--hide-scrollbars",
+]
+
+# Static assets we never need for text extraction
+_SKIP_ASSETS_RE = r"**/*.{png,jpg,jpeg,gif,svg,ico,css,woff,woff2,ttf,mp4}"
+
+# Chromium launch costs ~1-2s; keep one browser per process and hand out pages
+_pw_state: Dict[str, object] = {"pw": None, "browser": None, "context": None}
+_pw_lock = threading.Lock()
+
+
+def _close_browser():
+    with _pw_lock:
+        try:
+            if _pw_state["context"] is not None:
+                _pw_state["context"].close()  # type: ignore[union-attr]
+            if _pw_state["browser"] is not None:
+                _pw_state["browser"].close()  # type: ignore[union-attr]
+            if _pw_state["pw"] is not None:
+                _pw_state["pw"].stop()  # type: ignore[union-attr]
+        except Exception:
+            pass
+        _pw_state.update(pw=None, browser=None, context=None)
+
+
+def _get_browser_page(reuse_profile: bool):
+    from playwright.sync_api import sync_playwright  # type: ignore
+    with _pw_lock:
+        if _pw_state["pw"] is None:
+            pw = sync_playwright().start()
+            _pw_state["pw"] = pw
+            if reuse_profile:
+                # Persistent context pinned to a user-data dir: warm profile cache
+                # survives across CLI invocations, cutting cold-start latency.
+                user_data = Path.home() / ".cache" / "ats_builder" / "browser"
+                user_data.mkdir(parents=True, exist_ok=True)
+                _pw_state["context"] = pw.chromium.launch_persistent_context(str(user_data), headless=True, args=_BROWSER_ARGS)
+            else:
+                browser = pw.chromium.launch(headless=True, args=_BROWSER_ARGS)
+                _pw_state["browser"] = browser
+                _pw_state["context"] = browser.new_context()
+            atexit.register(_close_browser)
+    return _pw_state["context"].new_page()  # type: ignore[union-attr]
+
+
+def load_job_from_url_dynamic(url: str, title: Optional[str] = None, company: Optional[str] = None, location: Optional[str] = None, wait_selector: Optional[str] = None, timeout_ms: int = 15000, reuse_browser: bool = False) -> JobPosting:
     # Render JS via Playwright to get fully-hydrated HTML
     html = ""
     try:
-        from playwright.sync_api import sync_playwright  # type: ignore
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        page = _get_browser_page(reuse_browser)
+        try:
+            # Skip heavy static assets; we only need the rendered DOM text
+            try:
+                page.route(_SKIP_ASSETS_RE, lambda route: route.abort())
+            except Exception:
+                pass
             page.goto(url, timeout=timeout_ms)
             if wait_selector:
                 try:
@@ -142,9 +238,10 @@ def load_job_from_url_dynamic(url: str, title: Optional[str] = None, company: Op
                 except Exception:
                     pass
             html = page.content()
-            browser.close()
-    except Exception as e:
-        html = f""
+        finally:
+            page.close()
+    except Exception:
+        html = ""
     if not html:
         # Fallback to basic loader
         return load_job_from_url(url, title=title, company=company, location=location)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+# orjson serializes/parses several times faster than stdlib json and emits bytes
+# directly (no intermediate str copy). Fall back to stdlib when not installed.
+try:
+    import orjson  # type: ignore
+
+    def dump_json(path: str | Path, obj: Any) -> None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+    def load_json(path: str | Path) -> Any:
+        return orjson.loads(Path(path).read_bytes())
+
+except ImportError:
+
+    def dump_json(path: str | Path, obj: Any) -> None:
+        Path(path).write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def load_json(path: str | Path) -> Any:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
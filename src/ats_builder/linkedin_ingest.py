@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, List
 
+# LinkedIn exports can run to megabytes; orjson parses them several times
+# faster and accepts bytes directly (no separate UTF-8 decode pass).
+try:
+    import orjson as _json  # type: ignore
+except ImportError:
+    import json as _json  # type: ignore
+
 
 def load_linkedin_profile_json(path: str) -> Dict:
-    data = json.loads(Path(path).read_text(encoding="utf-8", errors="ignore"))
+    data = _json.loads(Path(path).read_bytes())
     # Some exports wrap content under specific keys; normalize a bit.
     if isinstance(data, dict) and "Profile" in data and isinstance(data["Profile"], dict):
         data = data["Profile"]
@@ -42,8 +48,9 @@ def load_linkedin_profile_json(path: str) -> Dict:
     for e in edus or []:
         institution = e.get("schoolName") or e.get("organization") or e.get("name") or ""
         degree = e.get("degreeName") or e.get("degree")
-        start = e.get("startYear") or (e.get("timePeriod", {}).get("startDate", {}).get("year") if isinstance(e.get("timePeriod"), dict) else None)
-        end = e.get("endYear") or (e.get("timePeriod", {}).get("endDate", {}).get("year") if isinstance(e.get("timePeriod"), dict) else None)
+        tp = e.get("timePeriod") if isinstance(e.get("timePeriod"), dict) else {}
+        start = e.get("startYear") or (tp.get("startDate") or {}).get("year")
+        end = e.get("endYear") or (tp.get("endDate") or {}).get("year")
         education.append({"institution": str(institution), "degree": str(degree) if degree else None, "start": str(start) if start else None, "end": str(end) if end else None})
 
     # Skills
@@ -5,7 +5,7 @@ import os
 import re
 from typing import Dict, List, Optional
 
-import requests
+from .netio import SESSION
 
 
 PPLX_API_URL = "https://api.perplexity.ai/chat/completions"
@@ -26,7 +26,7 @@ def call_perplexity(messages: List[Dict[str, str]], model: str = "sonar-reasonin
         "max_tokens": max_tokens,
     }
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             PPLX_API_URL,
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -43,8 +43,11 @@ def call_perplexity(messages: List[Dict[str, str]], model: str = "sonar-reasonin
         return None
 
 
+_DIGIT_RE = re.compile(r"\b\d+(?:[\.,]\d+)?\b")
+
+
 def _digits_set(text: str) -> set[str]:
-    return set(re.findall(r"\b\d+(?:[\.,]\d+)?\b", text or ""))
+    return {m.group(0) for m in _DIGIT_RE.finditer(text or "")}
 
 
 def _safe_rewrite_bullets(originals_by_role: Dict[int, List[str]], job_keywords: List[str], model: str, temperature: float) -> Dict[int, List[str]]:
@@ -91,14 +94,14 @@ def _safe_rewrite_bullets(originals_by_role: Dict[int, List[str]], job_keywords:
         for ridx, new_bullets in out.items():
             safe_list: List[str] = []
             originals = originals_by_role.get(ridx, [])
+            old_digits = [_digits_set(ob) for ob in originals]
             for i, nb in enumerate(new_bullets):
                 ob = originals[i] if i < len(originals) else ""
-                if not ob:
+                if not ob or nb == ob:
+                    # Unchanged text trivially preserves its digits
                     safe_list.append(nb)
                     continue
-                new_digits = _digits_set(nb)
-                old_digits = _digits_set(ob)
-                if new_digits - old_digits:
+                if _digits_set(nb) - old_digits[i]:
                     safe_list.append(ob)  # revert to original if new numbers appear
                 else:
                     safe_list.append(nb)
@@ -123,6 +126,91 @@ def refine_resume_ctx_with_llm(resume_ctx: Dict, job_keywords: List[str], model:
     return resume_ctx
 
 
+def refine_and_letter_with_llm(
+    resume_ctx: Dict,
+    job_keywords: List[str],
+    highlights: List[str],
+    personal_notes: Optional[str],
+    model: str = "sonar-reasoning-pro",
+    temperature: float = 0.4,
+) -> Optional[Dict]:
+    # Single round trip covering both bullet refinement and the cover letter —
+    # halves wall time versus two sequential completions. Returns None when the
+    # call or parsing fails so the caller can fall back to the two-step path.
+    originals_by_role: Dict[int, List[str]] = {}
+    for ridx, exp in enumerate(resume_ctx.get("experiences", [])):
+        originals_by_role[ridx] = [b.get("text", "") for b in exp.get("bullets", [])]
+    roles_payload = [{"role_index": ridx, "bullets": bullets} for ridx, bullets in originals_by_role.items()]
+    identity = resume_ctx.get("identity", {})
+    job = resume_ctx.get("job", {})
+    sys = (
+        "You are refining resume bullets and drafting a cover letter in one pass. "
+        "Strict rules: Do not invent facts, employers, titles, dates, or numbers. "
+        "Only paraphrase the bullets you are given, keeping all original facts intact. "
+        "Keep bullets concise (max ~28 words), action-first, and remove fluff. "
+        "The letter: 3 short paragraphs, natural and specific, using only the provided highlights. "
+        "Use US spelling. No first-person plural. No emojis."
+    )
+    usr_payload = {
+        "job_keywords": job_keywords[:40],
+        "roles": roles_payload,
+        "candidate": {k: v for k, v in identity.items() if k in ("name", "location", "links")},
+        "job": {k: job.get(k) for k in ("title", "company", "location")},
+        "highlights": highlights[:4],
+        "personal_notes": personal_notes or "",
+    }
+    usr = (
+        "Rewrite the bullets with light improvements and draft the cover letter. "
+        "Return JSON strictly in the schema: {\n"
+        "  \"roles\": [ { \"role_index\": int, \"bullets\": [string, ...] }, ... ],\n"
+        "  \"cover_letter\": { \"greeting\": string, \"paragraphs\": [string, string, string], \"closing\": string }\n"
+        "}\n"
+        "Keep the same number of bullets per role as input.\n\n"
+        "Input (JSON):\n" + json.dumps(usr_payload, ensure_ascii=False)
+    )
+    content = call_perplexity(
+        messages=[{"role": "system", "content": sys}, {"role": "user", "content": usr}],
+        model=model,
+        temperature=temperature,
+        max_tokens=2000,
+    )
+    if not content:
+        return None
+    try:
+        start = content.find("{")
+        end = content.rfind("}") + 1
+        obj = json.loads(content[start:end])
+        # Bullets: same numeric guardrail as the two-step path
+        out: Dict[int, List[str]] = {}
+        for role in obj.get("roles", []):
+            ridx = int(role.get("role_index"))
+            out[ridx] = [str(b) for b in role.get("bullets", [])]
+        for ridx, exp in enumerate(resume_ctx.get("experiences", [])):
+            new_bullets = out.get(ridx, [])
+            originals = originals_by_role.get(ridx, [])
+            for i, b in enumerate(exp.get("bullets", [])):
+                if i >= len(new_bullets):
+                    continue
+                nb = new_bullets[i]
+                ob = originals[i] if i < len(originals) else ""
+                if ob and (_digits_set(nb) - _digits_set(ob)):
+                    continue  # revert to original if new numbers appear
+                b["text"] = nb
+        # Letter: light validation as in generate_cover_letter_with_llm
+        letter = obj.get("cover_letter") or {}
+        paragraphs = letter.get("paragraphs", [])
+        letter_ctx = None
+        if isinstance(paragraphs, list) and paragraphs:
+            letter_ctx = {
+                "greeting": letter.get("greeting", "Hello,"),
+                "paragraphs": paragraphs[:3],
+                "closing": letter.get("closing", f"Best regards,\n{identity.get('name','')}"),
+            }
+        return {"resume_ctx": resume_ctx, "letter_ctx": letter_ctx}
+    except Exception:
+        return None
+
+
 def generate_cover_letter_with_llm(identity: Dict, job: Dict, highlights: List[str], personal_notes: Optional[str], model: str = "sonar-reasoning-pro", temperature: float = 0.5) -> Optional[Dict]:
     sys = (
         "Draft a concise, human-sounding cover letter in 3 short paragraphs. "
@@ -6,17 +6,25 @@ from collections import defaultdict
 from .schemas import Candidate, SelectionResult, SelectedBullet
 
 
+# One C-level translate call instead of chained strips per token
+_PUNCT_TBL = str.maketrans("", "", ".,;:!?")
+
+
 def _normalize_token(t: str) -> str:
-    return t.lower().strip().strip(".,;:!?")
+    return t.translate(_PUNCT_TBL).lower()
 
 
 def _token_set(text: str) -> set[str]:
     return { _normalize_token(t) for t in text.split() if t.strip() }
 
 
-def score_text_against_keywords(text: str, keywords: List[str]) -> float:
+def _keyword_set(keywords: List[str]) -> frozenset[str]:
+    return frozenset(_normalize_token(k) for k in keywords)
+
+
+def score_text_against_keywords(text: str, keywords: List[str] | frozenset[str]) -> float:
     tokens = _token_set(text)
-    kws = {_normalize_token(k) for k in keywords}
+    kws = keywords if isinstance(keywords, frozenset) else _keyword_set(keywords)
     if not tokens or not kws:
         return 0.0
     overlap = tokens & kws
@@ -26,7 +34,7 @@ def score_text_against_keywords(text: str, keywords: List[str]) -> float:
     return base * 0.7 + density * 0.3
 
 
-def _tfidf_similarity(bullets: List[str], job_text: str) -> List[float]:
+def _tfidf_similarity(bullets: List[str], job_text: str, jd_tokens: Optional[set[str]] = None) -> List[float]:
     try:
         from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
         from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
@@ -37,12 +45,14 @@ def _tfidf_similarity(bullets: List[str], job_text: str) -> List[float]:
         return [float(s[0]) for s in sim]
     except Exception:
         # Fallback: simple token Jaccard vs job text
-        jd_tokens = _token_set(job_text)
+        if jd_tokens is None:
+            jd_tokens = _token_set(job_text)
+        n_jd = len(jd_tokens)
         out = []
         for b in bullets:
             bt = _token_set(b)
             inter = len(bt & jd_tokens)
-            union = len(bt | jd_tokens) or 1
+            union = (len(bt) + n_jd - inter) or 1
             out.append(inter / union)
         return out
 
@@ -54,16 +64,31 @@ def select_bullets(
     budgets: Tuple[int, int, int] = (6, 4, 2),
 ) -> SelectionResult:
     selected: Dict[int, List[SelectedBullet]] = defaultdict(list)
+    # Fit TF-IDF once over the JD plus every bullet (one vocabulary/IDF pass),
+    # then scatter similarities back to their roles.
+    all_bullets: List[str] = []
+    owners: List[Tuple[int, int]] = []
+    for idx, exp in enumerate(candidate.work_experience):
+        for bidx, b in enumerate(exp.bullets):
+            all_bullets.append(b.text)
+            owners.append((idx, bidx))
+    sim_by_owner: Dict[Tuple[int, int], float] = {}
+    if job_text and all_bullets:
+        # Tokenize the JD once; only the non-sklearn fallback consumes it
+        sims = _tfidf_similarity(all_bullets, job_text, jd_tokens=_token_set(job_text))
+        sim_by_owner = dict(zip(owners, sims))
+    # Normalize keywords once instead of per bullet
+    kws_set = _keyword_set(keywords)
     # Recent experience first (assume provided in reverse-chronological; if not, still okay)
     for idx, exp in enumerate(candidate.work_experience):
         scored = []
-        bullet_texts = [b.text for b in exp.bullets]
-        sim_scores = _tfidf_similarity(bullet_texts, job_text) if (job_text and bullet_texts) else [0.0] * len(bullet_texts)
+        # Constant per role; hoisted out of the per-bullet loop
+        skill_bonus = 0.05 * len(frozenset(_normalize_token(s) for s in exp.skills) & kws_set)
         for bidx, b in enumerate(exp.bullets):
-            kw_score = score_text_against_keywords(b.text, keywords)
-            sem = sim_scores[bidx] if bidx < len(sim_scores) else 0.0
+            kw_score = score_text_against_keywords(b.text, kws_set)
+            sem = sim_by_owner.get((idx, bidx), 0.0)
             # Blend scores: semantic (0.6) + keyword (0.4). Add tiny boost for role skills overlap.
-            s = sem * 0.6 + kw_score * 0.4 + (0.05 * len(set(exp.skills) & set(keywords)))
+            s = sem * 0.6 + kw_score * 0.4 + skill_bonus
             if s > 0:
                 scored.append(SelectedBullet(role_index=idx, bullet_index=bidx, text=b.text, source_ids=b.source_ids, score=s))
         # Rank bullets and pick a budget based on recency
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session per process: connections (and their TLS handshakes) are
+# reused across API calls and JD fetches, with retries on transient errors.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+)
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
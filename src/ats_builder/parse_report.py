@@ -1,20 +1,76 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
 from .docs import read_text_generic, parse_resume_text, normalize_text
+from .jsonio import dump_json, load_json
+
+# Parse results keyed by content hash: unchanged files skip the parser entirely
+# on repeat runs. xxhash hashes at GB/s; blake2b is the stdlib fallback.
+_CACHE_DIR = Path.home() / ".cache" / "ats_builder" / "parse"
+
+_ALLOWED_EXTS = frozenset({".pdf", ".docx", ".txt", ".html", ".htm"})
+
+
+def _walk(root) -> List[Path]:
+    # os.scandir exposes entry type from the directory read itself, saving a
+    # stat() per entry versus Path.rglob
+    out: List[Path] = []
+    for entry in os.scandir(root):
+        if entry.is_dir():
+            out.extend(_walk(entry.path))
+        elif Path(entry.name).suffix.lower() in _ALLOWED_EXTS:
+            out.append(Path(entry.path))
+    return out
+
+
+def _content_key(raw: bytes) -> str:
+    try:
+        import xxhash  # type: ignore
+        return xxhash.xxh3_64(raw).hexdigest()
+    except Exception:
+        import hashlib
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
 def analyze_file(path: Path) -> Dict:
+    try:
+        raw_bytes = path.read_bytes()
+    except Exception as e:
+        return {"file": path.name, "error": str(e)}
+    cache_path = _CACHE_DIR / f"{_content_key(raw_bytes)}.json"
+    try:
+        row = load_json(cache_path)
+        # Same content may live under a different name since it was cached
+        row["file"] = path.name
+        row["ext"] = path.suffix.lower()
+        return row
+    except Exception:
+        pass
+    row = _analyze_text(path)
+    if "error" not in row:
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(".json.tmp")
+            dump_json(tmp, row)
+            tmp.replace(cache_path)
+        except Exception:
+            pass
+    return row
+
+
+def _analyze_text(path: Path) -> Dict:
     try:
         raw = read_text_generic(str(path))
     except Exception as e:
         return {"file": path.name, "error": str(e)}
     text = normalize_text(raw)
-    lines = [ln for ln in text.splitlines()]
+    # One C-level scan for the count; no per-line list materialized
+    line_count = 0 if not text else text.count("\n") + (not text.endswith("\n"))
     parsed = parse_resume_text(text)
     exp = parsed.get("work_experience", [])
     bullets = sum(len(e.get("bullets", [])) for e in exp)
@@ -37,7 +93,7 @@ def analyze_file(path: Path) -> Dict:
         "file": path.name,
         "ext": path.suffix.lower(),
         "chars": len(text),
-        "lines": len(lines),
+        "lines": line_count,
         "experiences": len(exp),
         "bullets": bullets,
         "education": len(edu),
@@ -51,16 +107,22 @@ def main():
     parser = argparse.ArgumentParser(description="Parse report: summarize what was extracted from a documents folder")
     parser.add_argument("--input", required=True, help="Folder containing resumes/letters (PDF/DOCX/TXT)")
     parser.add_argument("--out", help="Optional JSON path to write a detailed report")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (default: CPU count)")
     args = parser.parse_args()
 
     in_dir = Path(args.input)
-    files = sorted([p for p in in_dir.rglob("*") if p.suffix.lower() in {".pdf", ".docx", ".txt", ".html", ".htm"}])
+    files = sorted(_walk(in_dir))
     if not files:
         raise SystemExit("No supported files found (PDF/DOCX/TXT/HTML).")
 
-    rows: List[Dict] = []
-    for f in files:
-        rows.append(analyze_file(f))
+    # PDF/DOCX parsing is CPU-bound per file and independent across files, so
+    # fan out over processes; below a handful of files startup cost dominates.
+    if len(files) < 4:
+        rows: List[Dict] = [analyze_file(f) for f in files]
+    else:
+        workers = args.jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            rows = list(ex.map(analyze_file, files, chunksize=4))
 
     totals = {
         "files": len(rows),
@@ -82,7 +144,7 @@ def main():
 
     if args.out:
         Path(args.out).parent.mkdir(parents=True, exist_ok=True)
-        Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        dump_json(args.out, report)
         print(f"Wrote parse report: {args.out}")
 
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import shutil
+import subprocess
 from datetime import date
 from pathlib import Path
 from typing import Dict, Optional
 
 from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_TAB_ALIGNMENT
 
@@ -68,15 +72,43 @@ def _add_heading(doc: Document, text: str):
     return p
 
 
+def _append_bullets(doc: Document, texts):
+    # Bullets dominate the paragraph count, and each doc.add_paragraph/add_run
+    # pair costs style resolution plus several XML round-trips. Building the
+    # <w:p> subtrees directly keeps the per-bullet work to plain lxml appends.
+    style_id = doc.styles["List Bullet"].style_id
+    body = doc.element.body
+    for text in texts:
+        p = body.add_p()
+        ppr = OxmlElement("w:pPr")
+        pstyle = OxmlElement("w:pStyle")
+        pstyle.set(qn("w:val"), style_id)
+        spacing = OxmlElement("w:spacing")
+        spacing.set(qn("w:before"), "0")
+        spacing.set(qn("w:after"), "0")
+        ppr.append(pstyle)
+        ppr.append(spacing)
+        p.append(ppr)
+        r = OxmlElement("w:r")
+        t = OxmlElement("w:t")
+        t.set(qn("xml:space"), "preserve")
+        t.text = text or ""
+        r.append(t)
+        p.append(r)
+
+
 def _add_experience(doc: Document, ctx: Dict):
     _add_heading(doc, "Experience")
+    # Page geometry is fixed for the document; each section attribute walks the
+    # underlying XML, so compute the tab-stop edge once rather than per role.
+    sect = doc.sections[0]
+    right_edge = sect.page_width - sect.left_margin - sect.right_margin
     for exp in ctx.get("experiences", []):
         # Role line
         role_line = doc.add_paragraph()
         fmt = role_line.paragraph_format
         fmt.space_after = Pt(0)
         # Right-aligned date via tab stop
-        right_edge = doc.sections[0].page_width - doc.sections[0].left_margin - doc.sections[0].right_margin
         fmt.tab_stops.add_tab_stop(right_edge, alignment=WD_TAB_ALIGNMENT.RIGHT)
         role_text = f"{exp.get('role','')} | {exp.get('company','')}\t"
         role_run = role_line.add_run(role_text)
@@ -85,26 +117,23 @@ def _add_experience(doc: Document, ctx: Dict):
         if exp.get("start") or exp.get("end"):
             role_line.add_run(f"{exp.get('start','')} – {exp.get('end','')}")
         # Bullets
-        for b in exp.get("bullets", []):
-            bp = doc.add_paragraph(style="List Bullet")
-            bp.paragraph_format.space_before = Pt(0)
-            bp.paragraph_format.space_after = Pt(0)
-            bp.add_run(b.get("text", ""))
+        _append_bullets(doc, (b.get("text", "") for b in exp.get("bullets", [])))
 
 
 def _add_education(doc: Document, ctx: Dict):
     if not ctx.get("education"):
         return
     _add_heading(doc, "Education")
-    # Deduplicate at render time as well
+    # Deduplicate at render time as well; tuple keys hash without building an
+    # intermediate joined string
     seen = set()
     for ed in ctx.get("education", []):
-        key = "|".join([
+        key = (
             (ed.get("institution", "") or "").strip().lower(),
             (ed.get("degree", "") or "").strip().lower(),
-            str(ed.get("start", "")),
-            str(ed.get("end", "")),
-        ])
+            ed.get("start") or "",
+            ed.get("end") or "",
+        )
         if key in seen:
             continue
         seen.add(key)
@@ -160,23 +189,47 @@ def render_cover_letter(identity: Dict, letter_ctx: Dict, job_company: Optional[
     return out_path
 
 
-def try_export_pdf(docx_path: str) -> Optional[str]:
-    p = Path(docx_path)
-    pdf_path = p.with_suffix(".pdf")
+# Resolved once at import: docx2pdf's cold import (COM init on Windows) and the
+# PATH scan for soffice are too slow to repeat per exported file
+try:
+    from docx2pdf import convert as _docx2pdf_convert  # type: ignore
+except Exception:
+    _docx2pdf_convert = None
+_SOFFICE_PATH = shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def try_export_pdfs(docx_paths: list[str]) -> list[Optional[str]]:
+    # soffice accepts many inputs per invocation, so one process startup
+    # (~2-3s) is amortized over the whole batch. Returns one PDF path (or
+    # None) per input, in order.
+    results: Dict[str, Optional[str]] = {}
     # Prefer docx2pdf on Windows
-    try:
-        from docx2pdf import convert as docx2pdf_convert
-        docx2pdf_convert(str(p), str(pdf_path))
-        return str(pdf_path)
-    except Exception:
-        pass
-    # Fallback to LibreOffice headless if available
-    try:
-        import shutil, subprocess
-        soffice = shutil.which("soffice") or shutil.which("libreoffice")
-        if soffice:
-            subprocess.run([soffice, "--headless", "--convert-to", "pdf", str(p), "--outdir", str(p.parent)], check=True)
-            return str(pdf_path)
-    except Exception:
-        pass
-    return None
+    if _docx2pdf_convert is not None:
+        for dp in docx_paths:
+            p = Path(dp)
+            pdf_path = p.with_suffix(".pdf")
+            try:
+                _docx2pdf_convert(str(p), str(pdf_path))
+                results[dp] = str(pdf_path)
+            except Exception:
+                pass
+    # Fallback to LibreOffice headless if available, batched per output dir
+    pending = [dp for dp in docx_paths if dp not in results]
+    if pending and _SOFFICE_PATH:
+        by_dir: Dict[str, list[str]] = {}
+        for dp in pending:
+            by_dir.setdefault(str(Path(dp).parent), []).append(dp)
+        for outdir, group in by_dir.items():
+            try:
+                subprocess.run([_SOFFICE_PATH, "--headless", "--convert-to", "pdf", *group, "--outdir", outdir], check=True)
+            except Exception:
+                continue
+            for dp in group:
+                pdf_path = Path(dp).with_suffix(".pdf")
+                if pdf_path.exists():
+                    results[dp] = str(pdf_path)
+    return [results.get(dp) for dp in docx_paths]
+
+
+def try_export_pdf(docx_path: str) -> Optional[str]:
+    return try_export_pdfs([docx_path])[0]
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, List, Optional
 
 
 def _ask(prompt: str, default: str | None = None) -> str:
@@ -11,7 +15,132 @@ def _ask(prompt: str, default: str | None = None) -> str:
     return default if (not val and default is not None) else val
 
 
+def _find_editor() -> Optional[str]:
+    for candidate in (os.environ.get("VISUAL"), os.environ.get("EDITOR")):
+        if candidate:
+            return candidate
+    for name in ("nano", "vim", "vi"):
+        if shutil.which(name):
+            return name
+    return None
+
+
+def _dump_buffer(payload: Dict) -> tuple[str, str]:
+    # YAML is friendlier to hand-edit; fall back to pretty JSON without it
+    try:
+        import yaml  # type: ignore
+
+        return yaml.safe_dump(payload, allow_unicode=True, sort_keys=False), ".yml"
+    except ImportError:
+        import json
+
+        return json.dumps(payload, ensure_ascii=False, indent=2), ".json"
+
+
+def _load_buffer(text: str, extension: str) -> Dict:
+    if extension == ".yml":
+        import yaml  # type: ignore
+
+        return yaml.safe_load(text) or {}
+    import json
+
+    return json.loads(text)
+
+
+def _editor_review(resume_ctx: Dict, letter_ctx: Dict, editor: str) -> Dict:
+    # One editor session over the whole document replaces dozens of blocking
+    # prompts; the returned buffer is diffed against the original to build the
+    # same edits record the prompt flow produces.
+    edits = {"resume": {"edited": False, "bullets": []}, "letter": {"edited": False}}
+    ident = resume_ctx.get("identity", {})
+    payload = {
+        "identity": {
+            "name": ident.get("name", ""),
+            "email": ident.get("email", ""),
+            "phone": ident.get("phone", ""),
+            "location": ident.get("location", ""),
+        },
+        "experiences": [
+            {
+                "role": exp.get("role", ""),
+                "company": exp.get("company", ""),
+                "bullets": [b.get("text", "") for b in exp.get("bullets", [])],
+            }
+            for exp in resume_ctx.get("experiences", [])
+        ],
+        "skills": list(resume_ctx.get("skills", [])),
+        "letter": {
+            "greeting": letter_ctx.get("greeting", ""),
+            "paragraphs": list(letter_ctx.get("paragraphs", [])),
+            "closing": letter_ctx.get("closing", ""),
+        },
+    }
+    buf, ext = _dump_buffer(payload)
+    fd, path = tempfile.mkstemp(suffix=ext, prefix="ats_review_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(buf)
+        subprocess.run([editor, path], check=True)
+        with open(path, encoding="utf-8") as fh:
+            edited = _load_buffer(fh.read(), ext)
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    new_ident = edited.get("identity", {})
+    for key in ("name", "email", "phone", "location"):
+        ident[key] = str(new_ident.get(key, ident.get(key, "")) or "")
+    resume_ctx["identity"] = ident
+
+    for ri, (exp, new_exp) in enumerate(zip(resume_ctx.get("experiences", []), edited.get("experiences", []))):
+        old_bullets = exp.get("bullets", [])
+        new_texts: List[str] = [str(t) for t in new_exp.get("bullets", [])]
+        new_bullets = []
+        for bi, text in enumerate(new_texts):
+            if bi < len(old_bullets):
+                b = old_bullets[bi]
+                if text != b.get("text"):
+                    edits["resume"]["edited"] = True
+                    edits["resume"]["bullets"].append({"role_index": ri, "old": b.get("text"), "new": text})
+                    b["text"] = text
+                new_bullets.append(b)
+            elif text:
+                edits["resume"]["edited"] = True
+                new_bullets.append({"text": text, "source_ids": ["user_added"]})
+        if len(new_texts) < len(old_bullets):
+            edits["resume"]["edited"] = True
+        exp["bullets"] = new_bullets
+
+    new_skills = [str(s).strip() for s in edited.get("skills", []) if str(s).strip()]
+    resume_ctx["skills"] = new_skills
+
+    new_letter = edited.get("letter", {})
+    for key in ("greeting", "closing"):
+        val = str(new_letter.get(key, letter_ctx.get(key, "")) or "")
+        if val != letter_ctx.get(key, ""):
+            edits["letter"]["edited"] = True
+        letter_ctx[key] = val
+    new_paras = [str(p) for p in new_letter.get("paragraphs", [])]
+    if new_paras != list(letter_ctx.get("paragraphs", [])):
+        edits["letter"]["edited"] = True
+    letter_ctx["paragraphs"] = new_paras
+
+    return {"resume_ctx": resume_ctx, "letter_ctx": letter_ctx, "edits": edits}
+
+
 def interactive_review(resume_ctx: Dict, letter_ctx: Dict) -> Dict:
+    editor = _find_editor()
+    if editor:
+        try:
+            return _editor_review(resume_ctx, letter_ctx, editor)
+        except Exception as e:
+            print(f"Editor review failed ({e}); falling back to prompts.")
+    return _prompt_review(resume_ctx, letter_ctx)
+
+
+def _prompt_review(resume_ctx: Dict, letter_ctx: Dict) -> Dict:
     edits = {"resume": {"edited": False, "bullets": []}, "letter": {"edited": False}}
 
     print("\n--- Review: Header ---")
@@ -68,4 +197,3 @@ def interactive_review(resume_ctx: Dict, letter_ctx: Dict) -> Dict:
         edits["letter"]["edited"] = True
 
     return {"resume_ctx": resume_ctx, "letter_ctx": letter_ctx, "edits": edits}
-
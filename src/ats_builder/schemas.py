@@ -3,8 +3,16 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
+# msgspec decodes/converts nested payloads into the dataclasses below in one
+# C-level pass, skipping the per-field .get walks; optional, with a pure-Python
+# fallback when absent or when the payload needs the lenient manual coercions.
+try:
+    import msgspec  # type: ignore
+except ImportError:
+    msgspec = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Identity:
     name: str
     email: str
@@ -13,20 +21,20 @@ class Identity:
     links: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Artifact:
     source_id: str
     type: str  # e.g., "resume", "linkedin", "note"
     uri_or_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Bullet:
     text: str
     source_ids: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Experience:
     company: str
     role: str
@@ -37,7 +45,7 @@ class Experience:
     tools: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
     institution: str
     degree: Optional[str] = None
@@ -45,7 +53,7 @@ class Education:
     end: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     identity: Identity
     work_experience: List[Experience] = field(default_factory=list)
@@ -57,16 +65,18 @@ class Candidate:
     artifacts: List[Artifact] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPosting:
     text: str
     title: Optional[str] = None
     company: Optional[str] = None
     location: Optional[str] = None
     keywords: List[str] = field(default_factory=list)
+    # Keywords normalized once at load time (see evaluate.normalize_keywords)
+    norm_keywords: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectedBullet:
     role_index: int
     bullet_index: int
@@ -75,13 +85,13 @@ class SelectedBullet:
     score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionResult:
     selected_by_role: Dict[int, List[SelectedBullet]] = field(default_factory=dict)
     keywords: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderContext:
     candidate: Candidate
     job: JobPosting
@@ -96,7 +106,25 @@ def _get(d: Dict[str, Any], key: str, default):
     return v if v is not None else default
 
 
+def candidate_from_bytes(raw: bytes) -> Candidate:
+    if msgspec is not None:
+        return candidate_from_dict(msgspec.json.decode(raw))
+    import json
+    return candidate_from_dict(json.loads(raw))
+
+
 def candidate_from_dict(data: Dict[str, Any]) -> Candidate:
+    if msgspec is not None:
+        try:
+            cand = msgspec.convert(data, Candidate, strict=False)
+            # skills live under a nested {"hard": [...], "soft": [...]} key in
+            # the JSON, which convert() cannot map onto the flat fields
+            skills = data.get("skills") or {}
+            cand.skills_hard = skills.get("hard", [])
+            cand.skills_soft = skills.get("soft", [])
+            return cand
+        except Exception:
+            pass  # malformed/partial payloads take the lenient path below
     ident_d = data.get("identity", {})
     identity = Identity(
         name=ident_d.get("name", ""),
@@ -150,5 +178,7 @@ def candidate_from_dict(data: Dict[str, Any]) -> Candidate:
 
 
 def job_from_text(text: str, title: Optional[str] = None, company: Optional[str] = None, location: Optional[str] = None, keywords: Optional[List[str]] = None) -> JobPosting:
-    return JobPosting(text=text, title=title, company=company, location=location, keywords=keywords or [])
+    from .evaluate import normalize_keywords
+    kws = keywords or []
+    return JobPosting(text=text, title=title, company=company, location=location, keywords=kws, norm_keywords=normalize_keywords(kws))
 
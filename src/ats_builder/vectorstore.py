@@ -6,9 +6,33 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
 import joblib
+import numpy as np
 
+# sklearn's first import costs ~200 ms; resolve the symbols once so repeated
+# build/search calls skip even the per-call sys.modules lookups
+_SK = None
 
-@dataclass
+
+def _sklearn():
+    global _SK
+    if _SK is None:
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer  # type: ignore
+        from sklearn.pipeline import Pipeline  # type: ignore
+        from sklearn.preprocessing import normalize  # type: ignore
+        _SK = (HashingVectorizer, TfidfTransformer, Pipeline, normalize)
+    return _SK
+
+
+# LZ4 decompresses at GB/s, so compressed stores load faster too; zlib is the
+# always-available fallback
+try:
+    import lz4  # type: ignore  # noqa: F401
+    _COMPRESS = ("lz4", 3)
+except ImportError:
+    _COMPRESS = 3
+
+
+@dataclass(slots=True)
 class Chunk:
     text: str
     meta: Dict
@@ -21,23 +45,42 @@ class TfidfStore:
         self.matrix = None
 
     def build(self):
-        from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
+        # Feature hashing skips vocabulary construction (the pure-Python cost of
+        # TfidfVectorizer) and keeps the saved store vocabulary-free; the
+        # TfidfTransformer stage supplies the same IDF weighting.
+        HashingVectorizer, TfidfTransformer, Pipeline, normalize = _sklearn()
         texts = [c.text for c in self.chunks]
-        self.vectorizer = TfidfVectorizer(min_df=1, ngram_range=(1, 2))
-        self.matrix = self.vectorizer.fit_transform(texts)
+        self.vectorizer = Pipeline([
+            ("hash", HashingVectorizer(n_features=2 ** 18, ngram_range=(1, 2), alternate_sign=False)),
+            ("tfidf", TfidfTransformer()),
+        ])
+        # The matrix is immutable after build; L2-normalize rows once here so
+        # cosine similarity at query time is a plain sparse matvec.
+        self.matrix = normalize(self.vectorizer.fit_transform(texts), norm="l2", copy=False)
         return self
 
     def search(self, query: str, top_k: int = 8) -> List[Chunk]:
-        from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
         if not self.vectorizer or self.matrix is None:
             return []
-        q = self.vectorizer.transform([query])
-        sims = cosine_similarity(self.matrix, q).ravel()
-        idxs = sims.argsort()[::-1][:top_k]
+        normalize = _sklearn()[3]
+        qn = normalize(self.vectorizer.transform([query]), norm="l2", copy=False)
+        sims = (self.matrix @ qn.T).toarray().ravel()
+        if top_k < sims.size:
+            # Partition out the top k (O(n)) and sort only those k indices
+            idxs = np.argpartition(sims, -top_k)[-top_k:]
+            idxs = idxs[np.argsort(sims[idxs])[::-1]]
+        else:
+            idxs = sims.argsort()[::-1]
         return [self.chunks[i] for i in idxs]
 
     def save(self, path: str):
-        joblib.dump({"chunks": self.chunks, "vectorizer": self.vectorizer, "matrix": self.matrix}, path)
+        # Protocol 5 pickles the CSR matrix's numpy buffers out-of-band (no copy)
+        joblib.dump(
+            {"chunks": self.chunks, "vectorizer": self.vectorizer, "matrix": self.matrix},
+            path,
+            compress=_COMPRESS,
+            protocol=5,
+        )
 
     @staticmethod
     def load(path: str) -> "TfidfStore":
@@ -49,16 +92,18 @@ class TfidfStore:
 
 
 def build_chunks_from_candidate(candidate: Dict) -> List[Chunk]:
-    chunks: List[Chunk] = []
-    # Use bullets as chunks; include role/company meta
-    for ridx, exp in enumerate(candidate.get("work_experience", [])):
-        company = exp.get("company", "")
-        role = exp.get("role", "")
-        for b in exp.get("bullets", []):
-            chunks.append(Chunk(text=b.get("text", ""), meta={"role": role, "company": company, "role_index": ridx, "source_ids": b.get("source_ids", [])}))
+    # Use bullets as chunks; include role/company meta. Flat comprehensions
+    # keep the loop body in C and skip the repeated list.append lookups.
+    chunks: List[Chunk] = [
+        Chunk(
+            text=b.get("text", ""),
+            meta={"role": exp.get("role", ""), "company": exp.get("company", ""), "role_index": ridx, "source_ids": b.get("source_ids", [])},
+        )
+        for ridx, exp in enumerate(candidate.get("work_experience", []))
+        for b in exp.get("bullets", [])
+    ]
     # Optionally add skills and education lines
-    for s in candidate.get("skills", {}).get("hard", []):
-        chunks.append(Chunk(text=s, meta={"type": "skill"}))
+    chunks.extend(Chunk(text=s, meta={"type": "skill"}) for s in candidate.get("skills", {}).get("hard", []))
     return chunks
 
 